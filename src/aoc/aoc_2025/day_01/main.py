@@ -3,11 +3,32 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import List
 
+import numpy as np
+
 from aoc.utils import get_logger, simple_txt_parser
 
 logger = get_logger(__name__)
 
-ACTION_PATTERN = re.compile(r"^(?P<dir>[RL])(?P<amt>\d+)$", re.IGNORECASE)
+ACTION_PATTERN = re.compile(r"^(?P<dir>[RL])(?P<amt>\d+)$", re.IGNORECASE | re.MULTILINE)
+
+
+def parse_rotations(actions: List[str]) -> np.ndarray:
+  """Parse all actions at once into an int64 array of signed rotations (R positive, L negative).
+
+  The actions are joined into one text and matched line by line in a single regex pass, so the
+  pattern is not run separately for every action.
+  """
+  text = "\n".join(actions)
+  matches = ACTION_PATTERN.findall(text)
+  # Every action must be exactly one line and match the pattern
+  if len(matches) != len(actions) or text.count("\n") != max(len(actions) - 1, 0):
+    invalid = next((action for action in actions if not ACTION_PATTERN.fullmatch(action)), actions)
+    raise ValueError(f"Invalid action: {invalid}")
+  return np.fromiter(
+    (int(amount) if direction in "Rr" else -int(amount) for direction, amount in matches),
+    dtype=np.int64,
+    count=len(matches),
+  )
 
 
 @dataclass
@@ -16,43 +37,36 @@ class Safe:
   zeros_at_end: int = 0
   zeros_during: int = 0
 
-  def parse_rotation(self, action: str) -> int:
-    match = ACTION_PATTERN.match(action)
-    if not match:
-      raise ValueError(f"Invalid action: {action}")
-    direction = match.group("dir")
-    amount = int(match.group("amt"))
-    return (1 if direction == "R" else -1) * amount
-
   def apply_rotation(self, action: str) -> None:
-    rotation_delta = self.parse_rotation(action)
-    sign = 1 if rotation_delta > 0 else -1
-    abs_rotation = abs(rotation_delta)
-    start_pos = self.current_position
-    first_crossing = (-start_pos * sign) % 100
-    if abs_rotation <= 1:
-      during_crossings = 0
-    else:
-      if first_crossing == 0:
-        during_crossings = (abs_rotation - 1) // 100
-      else:
-        if first_crossing <= abs_rotation - 1:
-          during_crossings = (abs_rotation - 1 - first_crossing) // 100 + 1
-        else:
-          during_crossings = 0
-    self.zeros_during += during_crossings
-    new_position = (self.current_position + rotation_delta) % 100
-    if new_position == 0:
-      self.zeros_at_end += 1
-    logger.debug(
-      f"{action} | {self.current_position} {rotation_delta} -> {new_position} | "
-      f"during: {during_crossings}, total during: {self.zeros_during}"
-    )
-    self.current_position = new_position
+    self.apply_all_rotations([action])
 
   def apply_all_rotations(self, actions: List[str]) -> None:
-    for action in actions:
-      self.apply_rotation(action)
+    """Apply every rotation at once, counting the zeros landed on and the zeros passed during each one.
+
+    The position before each step is a prefix sum of the deltas (mod 100), so all steps can be
+    evaluated in a single vectorized pass instead of a sequential loop.
+    """
+    deltas = parse_rotations(actions)
+    if deltas.size == 0:
+      return
+    positions = (self.current_position + np.concatenate(([0], np.cumsum(deltas)))) % 100
+    start_pos = positions[:-1]
+    sign = np.where(deltas > 0, 1, -1)
+    abs_rotation = np.abs(deltas)
+    first_crossing = (-start_pos * sign) % 100
+    during_crossings = np.where(
+      abs_rotation <= 1,
+      0,
+      np.where(
+        first_crossing == 0,
+        (abs_rotation - 1) // 100,
+        np.where(first_crossing <= abs_rotation - 1, (abs_rotation - 1 - first_crossing) // 100 + 1, 0),
+      ),
+    )
+    self.zeros_during += int(during_crossings.sum())
+    self.zeros_at_end += int((positions[1:] == 0).sum())
+    self.current_position = int(positions[-1])
+    logger.debug("Rotations applied", count=deltas.size, position=self.current_position)
 
 
 def main(filename: str = "example.txt") -> None:
@@ -1,4 +1,4 @@
-import math
+from functools import cache
 from pathlib import Path
 
 from aoc.utils import get_logger, simple_txt_parser
@@ -6,8 +6,14 @@ from aoc.utils import get_logger, simple_txt_parser
 logger = get_logger(__name__)
 
 
+@cache
+def repeat_multiplier(b: int, k: int) -> int:
+  """Return the multiplier that repeats a b-digit base k times: base * mul == int(str(base) * k)."""
+  return sum(10 ** (b * i) for i in range(k))
+
+
 def p1(data: str) -> int:
-  invalid_ids: list[int] = []  # List to store the valid repeated numbers
+  range_sums: list[int] = []  # Sum of the valid repeated numbers found for each range and half-length
   for token in data.split(","):
     start, end = map(int, token.split("-"))
     logger.debug(f"Range: {start} - {end}")
@@ -17,22 +23,22 @@ def p1(data: str) -> int:
       factor = 10**h + 1  # Factor to generate repeated number: X * (10^h + 1) = int(str(X) + str(X))
       min_X = 10 ** (h - 1)  # Minimum X for h digits (e.g., 1 for h=1, 10 for h=2)
       max_X = 10**h - 1  # Maximum X for h digits (e.g., 9 for h=1, 99 for h=2)
-      # Calculate effective min X where num >= start
-      min_X_eff = math.ceil(start / factor)
+      # Calculate effective min X where num >= start (integer ceil division)
+      min_X_eff = -(-start // factor)
       # Calculate effective max X where num <= end
       max_X_eff = end // factor
-      # Iterate over valid X values within bounds
-      for X in range(max(min_X, min_X_eff), min(max_X, max_X_eff) + 1):
-        num = X * factor
-        if start <= num <= end:  # Double-check the range (though should be covered)
-          invalid_ids.append(num)
-          logger.debug(f"  Found: {num}")
+      # Sum all valid numbers for this h at once as an arithmetic series; the bounds guarantee start <= num <= end
+      lo, hi = max(min_X, min_X_eff), min(max_X, max_X_eff)
+      if lo <= hi:
+        range_sums.append(factor * (lo + hi) * (hi - lo + 1) // 2)
+        logger.debug(f"  Found {hi - lo + 1} numbers with half-length {h}")
 
-  return sum(invalid_ids)
+  return sum(range_sums)
 
 
 def p2(data: str) -> int:
-  invalid_ids: list[int] = []  # List to store the invalid repeated numbers
+  # The same number can be built from several (b, k) pairs (e.g. 1111 from 1 or 11), so count it once
+  invalid_ids: set[int] = set()
   for token in data.split(","):
     start, end = map(int, token.split("-"))
     logger.debug(f"Range: {start} - {end}")
@@ -42,17 +48,14 @@ def p2(data: str) -> int:
       # Iterate over repetition counts k >= 2, such that b * k <= len_end
       max_k = len_end // b
       for k in range(2, max_k + 1):
-        # Base number: from 10**(b-1) to 10**b - 1 (no leading zero unless b=1)
-        min_base = 10 ** (b - 1)
-        max_base = 10**b - 1
-        for base in range(min_base, max_base + 1):
-          base_str = str(base)
-          num_str = base_str * k
-          num = int(num_str)
-          if start <= num <= end and num not in invalid_ids:
-            invalid_ids.append(num)
-            logger.debug(f"  Found repeated {k} times: {num} (base: {base_str})")
+        mul = repeat_multiplier(b, k)
+        # Base number: from 10**(b-1) to 10**b - 1 (no leading zero unless b=1), clamped to the range
+        min_base = max(10 ** (b - 1), -(-start // mul))
+        max_base = min(10**b - 1, end // mul)
+        if min_base <= max_base:
+          invalid_ids.update(base * mul for base in range(min_base, max_base + 1))
 
+  logger.debug(f"Found {len(invalid_ids)} invalid IDs")
   return sum(invalid_ids)
 
 
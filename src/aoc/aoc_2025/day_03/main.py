@@ -1,3 +1,4 @@
+from bisect import bisect_right
 from pathlib import Path
 
 from aoc.utils import get_logger, simple_txt_parser
@@ -10,61 +11,49 @@ def find_max_voltage(bank: list[int], n_digits: int) -> int:
 
   A voltage is formed by concatenating n charge levels where each subsequent
   digit must appear at a later position than the previous one.
+
+  The greedy choice is local: at each step pick the largest digit whose first
+  occurrence after the previous pick still leaves enough batteries for the
+  remaining digits. This is a single left-to-right pass with no backtracking.
   """
+  n = len(bank)
   # Track all positions where each digit (0-9) appears, sorted
   positions: list[list[int]] = [[] for _ in range(10)]
   for j, battery in enumerate(bank):
     positions[battery].append(j)
 
-  logger.debug(f"Positions: {positions}")
-
-  def find_max_recursive(digits_remaining: int, min_pos: int) -> list[int]:
-    """Recursively find the max voltage digits starting from min_pos."""
-    if digits_remaining == 0:
-      return []
+  logger.debug("Positions", positions=positions)
 
+  voltage = 0
+  last_pos = -1  # Position of the previously picked digit
+  for step in range(n_digits):
+    # Number of digits that still have to fit after the one picked in this step
+    digits_after = n_digits - step - 1
     # Try digits from 9 down to 0 (greedy for max value)
     for digit in range(9, -1, -1):
-      # Find the first position >= min_pos using binary search
       digit_positions = positions[digit]
-      if not digit_positions:
-        continue
-
-      # Binary search for first position > min_pos
-      left, right = 0, len(digit_positions)
-      while left < right:
-        mid = (left + right) // 2
-        if digit_positions[mid] <= min_pos:
-          left = mid + 1
-        else:
-          right = mid
-
-      if left < len(digit_positions):
-        next_pos = digit_positions[left]
-        # Recursively find remaining digits
-        rest = find_max_recursive(digits_remaining - 1, next_pos)
-        if rest is not None and len(rest) == digits_remaining - 1:
-          return [digit] + rest
-
-    return []
-
-  digits = find_max_recursive(n_digits, -1)
+      # Binary search for first position > last_pos
+      idx = bisect_right(digit_positions, last_pos)
+      if idx < len(digit_positions) and n - 1 - digit_positions[idx] >= digits_after:
+        last_pos = digit_positions[idx]
+        voltage = voltage * 10 + digit
+        break
+    else:
+      # Not enough batteries left to form an n-digit voltage
+      return -1
 
-  if len(digits) == n_digits:
-    voltage = int("".join(map(str, digits)))
-    logger.debug(f"Max {n_digits}-digit voltage: {voltage}")
-    return voltage
-  return -1
+  logger.debug("Max voltage", n_digits=n_digits, voltage=voltage)
+  return voltage
 
 
 def solve(banks: list[list[int]], n_digits: int) -> int:
   voltages: list[int] = []
   for i, bank in enumerate(banks):
-    logger.debug(f"Processing bank {i}: {bank}")
+    logger.debug("Processing bank", index=i, bank=bank)
     max_voltage = find_max_voltage(bank, n_digits)
     logger.info(f"Bank {i}: Max Voltage = {max_voltage}")
     voltages.append(max_voltage)
-  logger.debug(f"Voltages: {voltages}")
+  logger.debug("Voltages", voltages=voltages)
   return sum(voltages)
 
 
@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import numpy as np
+
 from aoc.utils import get_logger, simple_txt_parser
 
 logger = get_logger(__name__)
@@ -13,55 +15,65 @@ DIRECTIONS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1,
 class BoolGrid:
   """Grid of boolean values with efficient neighbor counting."""
 
-  cells: list[list[bool]]
+  cells: np.ndarray  # 2D uint8 array, 1 where the cell is active
   width: int = field(init=False)
   height: int = field(init=False)
-  prefix: list[list[int]] = field(init=False, repr=False)
+  prefix: np.ndarray = field(init=False, repr=False)
 
   def __post_init__(self) -> None:
-    self.height = len(self.cells)
-    self.width = len(self.cells[0]) if self.height > 0 else 0
+    self.height, self.width = self.cells.shape if self.cells.size > 0 else (0, 0)
 
   @classmethod
   def from_data(cls, data: list[str], element: str = "@") -> "BoolGrid":
-    """Create a BoolGrid from input data."""
-    cells = [[char == element for char in line.strip()] for line in data]
+    """Create a BoolGrid from input data.
+
+    The rows are joined into one byte buffer and compared against the element in a single pass.
+    """
+    lines = [line.strip() for line in data]
+    width = len(lines[0]) if lines else 0
+    if any(len(line) != width for line in lines):
+      raise ValueError("All grid rows must have the same length.")
+    buffer = np.frombuffer("".join(lines).encode("ascii", errors="replace"), dtype=np.uint8)
+    cells = (buffer.reshape(len(lines), width) == ord(element)).astype(np.uint8)
     return cls(cells)
 
   def build_prefix_sum(self) -> None:
-    """Build 2D prefix sum array for efficient range queries."""
-    self.prefix = [[0] * (self.width + 1) for _ in range(self.height + 1)]
-    for r in range(1, self.height + 1):
-      for c in range(1, self.width + 1):
-        self.prefix[r][c] = (
-          self.prefix[r - 1][c] + self.prefix[r][c - 1] - self.prefix[r - 1][c - 1] + self.cells[r - 1][c - 1]
-        )
+    """Build 2D prefix sum array (integral image) for efficient range queries."""
+    integral = self.cells.astype(np.int32).cumsum(axis=0).cumsum(axis=1)
+    self.prefix = np.pad(integral, ((1, 0), (1, 0)))
 
   def count_neighbors_prefix(self, r: int, c: int) -> int:
     """Count active 8-neighbors using prefix sum (O(1) per query after O(n²) preprocessing)."""
     r1, c1 = max(0, r - 1), max(0, c - 1)
     r2, c2 = min(self.height - 1, r + 1), min(self.width - 1, c + 1)
-    total = self.prefix[r2 + 1][c2 + 1] - self.prefix[r2 + 1][c1] - self.prefix[r1][c2 + 1] + self.prefix[r1][c1]
-    return total - self.cells[r][c]  # Exclude center cell
+    total = self.prefix[r2 + 1, c2 + 1] - self.prefix[r2 + 1, c1] - self.prefix[r1, c2 + 1] + self.prefix[r1, c1]
+    return int(total - self.cells[r, c])  # Exclude center cell
 
   def count_neighbors(self, r: int, c: int) -> int:
     """Count active 8-neighbors by direct iteration (faster for sparse updates)."""
     count = 0
     for dr, dc in DIRECTIONS:
       nr, nc = r + dr, c + dc
-      if 0 <= nr < self.height and 0 <= nc < self.width and self.cells[nr][nc]:
+      if 0 <= nr < self.height and 0 <= nc < self.width and self.cells[nr, nc]:
         count += 1
     return count
 
+  def neighbor_counts(self) -> np.ndarray:
+    """Count active 8-neighbors for every cell at once by summing 8 shifted views of the padded grid."""
+    padded = np.pad(self.cells, 1)
+    counts = np.zeros_like(self.cells)
+    for dr, dc in DIRECTIONS:
+      counts += padded[1 + dr : 1 + dr + self.height, 1 + dc : 1 + dc + self.width]
+    return counts
+
+  def accessible(self) -> np.ndarray:
+    """Return a boolean mask of active cells with fewer than 4 active neighbors."""
+    return (self.cells == 1) & (self.neighbor_counts() < 4)
+
 
 def part_1(data: list[str]) -> int:
   grid = BoolGrid.from_data(data)
-  result = sum(
-    1
-    for r in range(grid.height)  # rows
-    for c in range(grid.width)  # columns
-    if grid.cells[r][c] and grid.count_neighbors(r, c) < 4
-  )
+  result = int(grid.accessible().sum())
   return result
 
 
@@ -71,21 +83,15 @@ def part_2(data: list[str]) -> int:
 
   for _ in range(1000):
     # Find all cells to remove this iteration
-    to_remove = [
-      (r, c)
-      for r in range(grid.height)
-      for c in range(grid.width)
-      if grid.cells[r][c] and grid.count_neighbors(r, c) < 4
-    ]
-
-    if not to_remove:
+    to_remove = grid.accessible()
+
+    if not to_remove.any():
       break
 
     # Remove all marked cells
-    for r, c in to_remove:
-      grid.cells[r][c] = False
+    grid.cells[to_remove] = 0
 
-    result += len(to_remove)
+    result += int(to_remove.sum())
   else:
     logger.warning("Reached maximum iterations.")
 
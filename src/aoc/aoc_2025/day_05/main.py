@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
+
 from aoc.utils import get_logger, simple_txt_parser
 
 logger = get_logger(__name__)
@@ -74,13 +76,15 @@ class KMS:
 def part_1(data: list[str]) -> int:
   """Count how many inventory items fall within any fresh range."""
   kms = KMS.from_data(data)
-  count_fresh = 0
-  for item in kms.inventory:
-    for start, end in kms.fresh_ranges:
-      if start <= item <= end:
-        count_fresh += 1
-        break
-  return count_fresh
+  if not kms.fresh_ranges:
+    return 0
+  # Ranges are sorted and disjoint, so each item can only belong to the last range starting at or before it
+  starts = np.array([start for start, _ in kms.fresh_ranges], dtype=np.int64)
+  ends = np.array([end for _, end in kms.fresh_ranges], dtype=np.int64)
+  items = np.array(kms.inventory, dtype=np.int64)
+  idx = np.searchsorted(starts, items, side="right") - 1
+  is_fresh = (idx >= 0) & (items <= ends[np.maximum(idx, 0)])
+  return int(is_fresh.sum())
 
 
 def part_2(data: list[str]) -> int:
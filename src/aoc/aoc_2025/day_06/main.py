@@ -1,31 +1,45 @@
 from __future__ import annotations
 
-from functools import reduce
+import math
+import operator
+from functools import partial, reduce
 from pathlib import Path
 
+import numpy as np
+
 from aoc.utils import get_logger, simple_txt_parser
 
 logger = get_logger(__name__)
 
-OPERATORS = {"+": lambda x, y: x + y, "-": lambda x, y: x - y, "*": lambda x, y: x * y, "/": lambda x, y: x / y}
+OPERATORS = {"+": operator.add, "-": operator.sub, "*": operator.mul, "/": operator.truediv}
+# Left-associative fold of a list of values per operator, using the dedicated builtins where they exist
+REDUCERS = {symbol: partial(reduce, op) for symbol, op in OPERATORS.items()} | {"+": sum, "*": math.prod}
+NUMPY_REDUCERS = {"+": np.add.reduce, "-": np.subtract.reduce, "*": np.multiply.reduce, "/": np.divide.reduce}
 
+# Byte classification table for part_2: 0 for spaces, DIGIT for '0'-'9', and DIGIT + 1 + i for the i-th operator
+DIGIT = 1
+BYTE_CLASS = bytearray(256)
+BYTE_CLASS[ord("0") : ord("9") + 1] = bytes([DIGIT]) * 10
+for code, symbol in enumerate(OPERATORS, start=DIGIT + 1):
+  BYTE_CLASS[ord(symbol)] = code
+REDUCER_BY_CLASS = (None, None, *(REDUCERS[symbol] for symbol in OPERATORS))
 
-def part_1(input: list[str]) -> int:
-  # Parse input into a 2D list
-  data = [line.strip().split() for line in input]
-  result = 0
-  rows = len(data)
-  cols = len(data[0]) if data else 0
 
-  for j in range(cols):  # Process each column directly
-    # Extract values (all rows except last) and operator (last row)
-    values = [int(data[i][j]) for i in range(rows - 1)]
-    operator = data[-1][j]
+def part_1(input: list[str]) -> int:
+  # Parse input into a 2D array of Python ints (one problem per column, object dtype so products
+  # cannot overflow) and the operator row
+  rows = [line.split() for line in input]
+  if len(rows) < 2:
+    return 0
+  values = np.array([[int(token) for token in row] for row in rows[:-1]], dtype=object)
+  operators = np.array(rows[-1])
 
-    if values:
-      # Use reduce for left-associative accumulation
-      accumulator = reduce(OPERATORS[operator], values)
-      result += accumulator
+  result = 0
+  for symbol, reducer in NUMPY_REDUCERS.items():
+    # Left-associative accumulation down every column using this operator at once
+    columns = values[:, operators == symbol]
+    if columns.size:
+      result += reducer(columns, axis=0).sum()
 
   return result
 
@@ -35,22 +49,23 @@ def part_2(data: list[str]) -> int:
     return 0
 
   result = 0
-  rows = len(data)
-  cols = len(data[0])
+  rows = [line.encode() for line in data]
+  cols = len(rows[0])
   values: list[int] = []
 
   for j in range(cols - 1, -1, -1):
     all_spaces = True
     values.append(0)  # Start building a new number for this column
-    for i in range(rows):
-      char = data[i][j]
-      if char.isdigit():
-        values[-1] = values[-1] * 10 + int(char)
+    for row in rows:
+      byte = row[j]
+      kind = BYTE_CLASS[byte]
+      if kind == DIGIT:
+        values[-1] = values[-1] * 10 + byte - 48
         all_spaces = False
-      elif char in OPERATORS:
-        logger.debug(f"Processing operator '{char}' with values {values}")
-        accumulator = reduce(OPERATORS[char], values)
-        logger.debug(f"Intermediate result: {accumulator}")
+      elif kind:
+        logger.debug("Processing operator", operator=chr(byte), values=values)
+        accumulator = REDUCER_BY_CLASS[kind](values)
+        logger.debug("Intermediate result", accumulator=accumulator)
         result += accumulator
         values = []
         all_spaces = False
@@ -49,34 +49,41 @@ class Grid:
     r0: int,
     c0: int,
     direction: Literal["N", "E", "S", "W"],
-    visited: set[Coords],
+    visited: bytearray,
   ) -> int:
-    """Recursively count splittings from position (r0, c0) in a direction.
+    """Iteratively count splittings from position (r0, c0) in a direction.
 
-    The function treats r0/c0 as (row, col) coordinates. It will stop when a
+    The function treats r0/c0 as (row, col) coordinates and marks cells in
+    visited (one byte per cell) at their packed index r * width + c. A branch stops when a
     position is out of bounds or already visited. When a branching marker '^'
-    is found it counts a split and explores both side branches.
+    is found it counts a split and queues both side branches.
     """
-    # Stop if current position is out of bounds or already visited
-    if not self.is_in_bounds(r0, c0) or (r0, c0) in visited:
-      return 0
+    delta_r, delta_c = DIRECTIONS[direction]
+    splits = 0
+    stack: list[Coords] = [(r0, c0)]
 
-    visited.add((r0, c0))
+    while stack:
+      r, c = stack.pop()
 
-    # Move one step in the requested direction
-    delta_r, delta_c = DIRECTIONS[direction]
-    r, c = r0 + delta_r, c0 + delta_c
+      # Walk the straight run until it leaves the grid, merges into a visited cell or hits a fork
+      while self.is_in_bounds(r, c) and not visited[key := r * self.width + c]:
+        visited[key] = 1
 
-    # If the next location is out of bounds we cannot continue
-    if not self.is_in_bounds(r, c):
-      return 0
+        # Move one step in the requested direction
+        r, c = r + delta_r, c + delta_c
 
-    # '^' represents a fork: count it (1) and explore both side branches
-    if self.cells[r][c] == "^":
-      return 1 + self.compute_splits(r, c - 1, direction, visited) + self.compute_splits(r, c + 1, direction, visited)
+        # If the next location is out of bounds we cannot continue
+        if not self.is_in_bounds(r, c):
+          break
 
-    # Otherwise continue walking in the same direction
-    return self.compute_splits(r, c, direction, visited)
+        # '^' represents a fork: count it (1) and explore both side branches
+        if self.cells[r][c] == "^":
+          splits += 1
+          stack.append((r, c + 1))
+          stack.append((r, c - 1))
+          break
+
+    return splits
 
   def compute_paths_rec(
     self,
@@ -122,49 +129,53 @@ class Grid:
     """Iteratively count the number of paths from (r0, c0) moving SOUTH.
 
     Uses dynamic programming to compute path counts from bottom to top, caching in visited.
-    A path ends when the next move would be out of bounds. At a '^' split, sums paths from both side branches.
+    A path ends when the next move would be out of bounds. At a '^' split, sums paths from both side branches
+    (a branch that leaves the grid contributes no paths).
+
+    Each row depends only on the row below: it is a copy of that row, with the cells above a split
+    overwritten by the sum of the two branches. Splits are sparse, so only their columns are updated.
+    Counts can double at every row of splits, so they are kept as Python ints.
     """
-    if visited is None:
-      visited = [[0 for _ in range(self.width)] for _ in range(self.height)]
+    # Columns of the '^' cells in each row
+    split_cols = [[c for c, char in enumerate(row[: self.width]) if char == "^"] for row in self.cells]
 
-    # Compute paths for all cells from bottom to top
-    for r in range(self.height - 1, -1, -1):
-      for c in range(self.width):
-        delta_r, delta_c = DIRECTIONS["S"]
-        next_r, next_c = r + delta_r, c + delta_c
+    # Rows padded with an always-zero column on each side, so branches leaving the grid read 0
+    paths: list[list[int]] = [[] for _ in range(self.height)]
 
-        if not self.is_in_bounds(next_r, next_c):
-          # End of path
-          paths = 1
-        elif self.cells[next_r][next_c] == "^":
-          # Split: sum paths from left and right branches
-          left = (next_r, next_c - 1)
-          right = (next_r, next_c + 1)
-          paths = visited[left[0]][left[1]] + visited[right[0]][right[1]]
-        else:
-          # Continue straight
-          paths = visited[next_r][next_c]
+    # Bottom row: the next move leaves the grid, so every cell is the end of exactly one path
+    paths[self.height - 1] = [0] + [1] * self.width + [0]
 
-        visited[r][c] = paths
+    # Compute paths for the remaining rows from bottom to top
+    for r in range(self.height - 2, -1, -1):
+      below = paths[r + 1]
+      # Continue straight
+      row = below.copy()
+      # Split: sum paths from left and right branches (padded columns c and c + 2 around c + 1)
+      for c in split_cols[r + 1]:
+        row[c + 1] = below[c] + below[c + 2]
+      paths[r] = row
 
-    return visited[r0][c0]
+    if visited is not None:
+      visited[:] = [row[1:-1] for row in paths]
+    return paths[r0][c0 + 1]
 
 
-def part_1(data: list[str]) -> int:
+def load(data: list[str]) -> tuple[Grid, Coords]:
+  """Parse the grid and locate its start, so both parts can share the result."""
   grid = Grid.from_data(data)
-  start = grid.get_start_position()
-  visited = set()
+  return grid, grid.get_start_position()
+
+
+def part_1(grid: Grid, start: Coords) -> int:
+  visited = bytearray(grid.height * grid.width)
   splits = grid.compute_splits(start[0], start[1], "S", visited)
   return splits
 
 
-def part_2(data: list[str]) -> int:
-  grid = Grid.from_data(data)
-  start = grid.get_start_position()
+def part_2(grid: Grid, start: Coords) -> int:
   # visited: dict[Coords, int] = {}
   # paths = grid.compute_paths_rec(start[0], start[1], "S", visited)
-  visited = [[0 for _ in range(grid.width)] for _ in range(grid.height)]
-  paths = grid.compute_paths_dp(start[0], start[1], visited)
+  paths = grid.compute_paths_dp(start[0], start[1])
   return paths
 
 
@@ -173,6 +184,7 @@ if __name__ == "__main__":
   filename: str = "input.txt"
   file_path = Path(__file__).parent / filename
   data = simple_txt_parser(file_path, lambda x: x.strip())
+  grid, start = load(data)
 
-  logger.info(f"Part 1: {part_1(data)}")  # 1594
-  logger.info(f"Part 2: {part_2(data)}")  # 15650261281478
+  logger.info(f"Part 1: {part_1(grid, start)}")  # 1594
+  logger.info(f"Part 2: {part_2(grid, start)}")  # 15650261281478
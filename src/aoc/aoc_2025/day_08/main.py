@@ -1,81 +1,112 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
 
-import networkx as nx
+import numpy as np
+from scipy.sparse import coo_array
+from scipy.sparse.csgraph import connected_components
 
-from aoc.utils import get_logger, simple_txt_parser
+from aoc.utils import fast_bytes_parser, get_logger
 
 logger = get_logger(__name__)
 
 
-def l2_norm(p1: list[int], p2: list[int]) -> int:
-  return sum((a - b) ** 2 for a, b in zip(p1, p2, strict=True))
+@dataclass
+class DisjointSet:
+  """Union-find over n elements with union by size and path compression.
 
+  Tracks the size of each root's set and the number of disjoint sets (connected components).
+  """
 
-def part_1(data: list[str], max_iterations: int = 10) -> int:
-  points = [list(map(int, line.strip().split(","))) for line in data]
-  n = len(points)
+  parent: list[int]
+  size: list[int]
+  components: int
 
-  # Pre-compute all pairwise distances as (distance, i, j) tuples
-  dists = []
-  for i in range(n):
-    for j in range(i + 1, n):
-      dist = l2_norm(points[i], points[j])
-      dists.append((dist, i, j))
+  @classmethod
+  def with_size(cls, n: int) -> DisjointSet:
+    """Create n singleton sets."""
+    return cls(parent=list(range(n)), size=[1] * n, components=n)
 
-  # Sort by distance
-  dists.sort()
+  def find(self, x: int) -> int:
+    """Return the root of x's set, pointing every node on the path directly at it."""
+    root = x
+    while self.parent[root] != root:
+      root = self.parent[root]
+    while self.parent[x] != root:
+      self.parent[x], x = root, self.parent[x]
+    return root
 
-  # Build graph by adding edges in order of distance
-  G = nx.Graph()
-  G.add_nodes_from(range(n))
+  def union(self, a: int, b: int) -> bool:
+    """Merge the sets of a and b. Returns False if they were already in the same set."""
+    root_a, root_b = self.find(a), self.find(b)
+    if root_a == root_b:
+      return False
+    # Attach the smaller tree under the larger one
+    if self.size[root_a] < self.size[root_b]:
+      root_a, root_b = root_b, root_a
+    self.parent[root_b] = root_a
+    self.size[root_a] += self.size[root_b]
+    self.components -= 1
+    return True
 
-  # If max_iterations is None, add all edges
-  for k in range(max_iterations or len(dists)):
-    _, i, j = dists[k]
-    G.add_edge(i, j)
 
-  # Get connected components as clusters
-  cluster_sizes = [len(c) for c in sorted(nx.connected_components(G), key=len, reverse=True)]
-  # Multiply the 3 largest cluster sizes
-  return cluster_sizes[0] * cluster_sizes[1] * cluster_sizes[2]
+def load_points(file_path: Path) -> np.ndarray:
+  """Parse the 'x,y,z' lines of a file into an (n, 3) int64 array in a single C-level pass."""
+  return np.loadtxt(fast_bytes_parser(file_path), delimiter=",", dtype=np.int64, ndmin=2)
+
 
+def sorted_edges(points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+  """Return the (i, j) endpoints (i < j) of every pair of points, sorted by squared L2 distance.
 
-def part_2(data: list[str]) -> int:
-  points = [list(map(int, line.strip().split(","))) for line in data]
+  Distances are computed for all pairs at once with NumPy. The stable sort keeps ties in (i, j)
+  order, the same order as sorting (distance, i, j) tuples.
+  """
+  i_idx, j_idx = np.triu_indices(len(points), k=1)
+  dists = ((points[i_idx] - points[j_idx]) ** 2).sum(axis=1)
+  order = np.argsort(dists, kind="stable")
+  return i_idx[order], j_idx[order]
+
+
+def part_1(points: np.ndarray, max_iterations: int = 10) -> int:
   n = len(points)
 
-  # Pre-compute all pairwise distances as (distance, i, j) tuples
-  dists = []
-  for i in range(n):
-    for j in range(i + 1, n):
-      dist = l2_norm(points[i], points[j])
-      dists.append((dist, i, j))
+  # Pre-compute all pairwise edges, sorted by distance
+  edges_i, edges_j = sorted_edges(points)
+
+  # Join clusters by adding edges in order of distance: the clusters are the connected components
+  # of the graph made of the k shortest edges. If max_iterations is None, add all edges
+  k = max_iterations or len(edges_i)
+  adjacency = coo_array((np.ones(len(edges_i[:k]), dtype=np.int8), (edges_i[:k], edges_j[:k])), shape=(n, n))
+  _, labels = connected_components(adjacency, directed=False)
 
-  # Sort by distance
-  dists.sort()
+  # Multiply the 3 largest cluster sizes
+  cluster_sizes = np.sort(np.bincount(labels))[::-1]
+  return int(cluster_sizes[0] * cluster_sizes[1] * cluster_sizes[2])
 
-  # Build graph by adding edges in order of distance until all connected
-  G = nx.Graph()
-  G.add_nodes_from(range(n))
 
-  last_edge: tuple[int, int] | None = None
-  for k in range(len(dists)):
-    _, i, j = dists[k]
-    G.add_edge(i, j)
-    last_edge = (i, j)
+def part_2(points: np.ndarray) -> int:
+  n = len(points)
 
-    # Check if we have exactly 1 connected component
-    if nx.number_connected_components(G) == 1:
+  # Pre-compute all pairwise edges, sorted by distance
+  edges_i, edges_j = sorted_edges(points)
+
+  # Join clusters by adding edges in order of distance until all connected
+  clusters = DisjointSet.with_size(n)
+
+  last_edge: tuple[int, int] | None = None
+  for i, j in zip(edges_i.tolist(), edges_j.tolist(), strict=True):
+    # Only an edge that merges two clusters can leave exactly 1 connected component
+    if clusters.union(i, j) and clusters.components == 1:
+      last_edge = (i, j)
       break
 
   # Extract X coordinates from the last edge added
   if last_edge is None:
     return 0
   i, j = last_edge
-  x_i = points[i][0]
-  x_j = points[j][0]
+  x_i = int(points[i, 0])
+  x_j = int(points[j, 0])
   result = x_i * x_j
 
   return result
@@ -85,8 +116,8 @@ if __name__ == "__main__":
   # Run the solutions for both parts using the input file
   filename: str = "input.txt"
   file_path = Path(__file__).parent / filename
-  data = simple_txt_parser(file_path)
+  points = load_points(file_path)
 
   logger.info("Starting Day 08 Solutions")
-  logger.info(f"Part 1: {part_1(data, max_iterations=1000)}")  # 62186
-  logger.info(f"Part 2: {part_2(data)}")  # 8420405530
+  logger.info(f"Part 1: {part_1(points, max_iterations=1000)}")  # 62186
+  logger.info(f"Part 2: {part_2(points)}")  # 8420405530
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from itertools import combinations_with_replacement
 from pathlib import Path
 
+import numpy as np
+
 from aoc.utils import get_logger, simple_txt_parser
 
 logger = get_logger(__name__)
@@ -10,13 +11,6 @@ logger = get_logger(__name__)
 type Coords = tuple[int, int]
 
 
-def area_rectangle(p0: Coords, p1: Coords) -> int:
-  """Return the area of the axis-aligned rectangle defined by points p0 and p1."""
-  dr = abs(p1[0] - p0[0])
-  dc = abs(p1[1] - p0[1])
-  return (dr + 1) * (dc + 1)
-
-
 def parse_coords(raw: list[str]) -> list[Coords]:
   """Convert raw lines (like "r,c") into a list of coordinate tuples."""
   coords: list[Coords] = []
@@ -29,55 +23,83 @@ def parse_coords(raw: list[str]) -> list[Coords]:
   return coords
 
 
+def area_matrix(coords: list[Coords]) -> np.ndarray:
+  """Return the (N, N) matrix of rectangle areas for every pair of points.
+
+  Entry [i, j] is the area of the axis-aligned rectangle with corners coords[i] and coords[j],
+  (|dr| + 1) * (|dc| + 1), computed with broadcasting instead of a Python loop over the pairs.
+  """
+  arr = np.asarray(coords, dtype=np.int64).reshape(-1, 2)
+  dr = np.abs(np.subtract.outer(arr[:, 0], arr[:, 0]))
+  dc = np.abs(np.subtract.outer(arr[:, 1], arr[:, 1]))
+  return (dr + 1) * (dc + 1)
+
+
 def max_rectangle_area(coords: list[Coords]) -> tuple[int, Coords, Coords]:
   """Return the maximum rectangle area and the pair of points that yield it."""
-  best_area = -1
-  best_pair: tuple[Coords, Coords] = ((0, 0), (0, 0))
+  if not coords:
+    return -1, (0, 0), (0, 0)
 
-  for p0, p1 in combinations_with_replacement(coords, 2):
-    a = area_rectangle(p0, p1)
-    if a > best_area:
-      best_area = a
-      best_pair = (p0, p1)
-
-  return best_area, best_pair[0], best_pair[1]
+  areas = area_matrix(coords)
+  i, j = np.unravel_index(np.argmax(areas), areas.shape)
+  return int(areas[i, j]), coords[i], coords[j]
 
 
 def part_1(raw: list[str]) -> int:
   coords = parse_coords(raw)
   area, p0, p1 = max_rectangle_area(coords)
-  logger.debug(f"Max rectangle area found: {area} between points {p0} and {p1}")
+  logger.debug("Max rectangle area found", area=area, p0=p0, p1=p1)
   return area
 
 
+def sorted_endpoints(a: np.ndarray, b: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+  """Order each pair of (N, 2) points lexicographically and return them as r0, c0, r1, c1 arrays.
+
+  This is the vectorized equivalent of sorted([p0, p1]) applied row by row.
+  """
+  swap = (a[:, 0] > b[:, 0]) | ((a[:, 0] == b[:, 0]) & (a[:, 1] > b[:, 1]))
+  first = np.where(swap[:, None], b, a)
+  second = np.where(swap[:, None], a, b)
+  return first[:, 0], first[:, 1], second[:, 0], second[:, 1]
+
+
+# Number of candidate rectangles tested against all edges at once in part_2
+BLOCK_SIZE = 1024
+
+
 def part_2(raw: list[str]) -> int:
   vertices = parse_coords(raw)
   n = len(vertices)
+  points = np.asarray(vertices, dtype=np.int64).reshape(-1, 2)
   # The vertices are given in order around the polygon. We generate the edges by connecting
   # each vertex to the previous one (with wrap-around for the first vertex). Each edge is
   # sorted to ensure consistent (min, max) ordering.
-  edges = [sorted([vertices[i], vertices[i - 1]]) for i in range(n)]
-
-  areas: list[tuple[int, Coords, Coords]] = []
-  for p0, p1 in combinations_with_replacement(vertices, 2):
-    area = area_rectangle(p0, p1)
-    v0, v1 = sorted([p0, p1])
-    areas.append((area, v0, v1))
-
-  # Sort edges by area descending for efficient lookup
-  edges.sort(reverse=True, key=lambda edge: area_rectangle(edge[0], edge[1]))
-  areas.sort(reverse=True)
-  for area, (r0, c0), (r1, c1) in areas:
-    logger.debug(f"Rectangle size {area} between points ({r0}, {c0}) and ({r1}, {c1})")
-    # Sort the column coordinates to ensure c0 <= c1, which normalizes the rectangle's orientation
-    # without changing its area or validity, allowing consistent edge intersection checks
-    c0, c1 = sorted((c0, c1))
-    if not any((r3 > r0 and r2 < r1 and c3 > c0 and c2 < c1) for (r2, c2), (r3, c3) in edges):
-      logger.debug(f"Found valid rectangle of size {area} between points ({r0}, {c0}) and ({r1}, {c1})")
-      return area
-    logger.debug(
-      f"Rectangle of size {area} between points ({r0}, {c0}) and ({r1}, {c1}) is invalid due to edge intersection"
+  er0, ec0, er1, ec1 = sorted_endpoints(points, np.roll(points, 1, axis=0))
+
+  # Candidate rectangles for every pair (upper triangle, diagonal included), sorted by area descending
+  i_idx, j_idx = np.triu_indices(n)
+  r0, c0, r1, c1 = sorted_endpoints(points[i_idx], points[j_idx])
+  # Sort the column coordinates to ensure c0 <= c1, which normalizes the rectangle's orientation
+  # without changing its area or validity, allowing consistent edge intersection checks
+  c0, c1 = np.minimum(c0, c1), np.maximum(c0, c1)
+  areas = (r1 - r0 + 1) * (c1 - c0 + 1)
+  order = np.argsort(-areas, kind="stable")
+
+  # Test candidates in blocks so the (candidates x edges) intersection matrix stays bounded
+  for start in range(0, len(order), BLOCK_SIZE):
+    block = order[start : start + BLOCK_SIZE]
+    intersect = (
+      (er1[None, :] > r0[block, None])
+      & (er0[None, :] < r1[block, None])
+      & (ec1[None, :] > c0[block, None])
+      & (ec0[None, :] < c1[block, None])
     )
+    valid = np.flatnonzero(~intersect.any(axis=1))
+    if valid.size:
+      k = block[valid[0]]
+      area = int(areas[k])
+      logger.debug("Found valid rectangle", area=area, p0=(int(r0[k]), int(c0[k])), p1=(int(r1[k]), int(c1[k])))
+      return area
   raise ValueError("No valid rectangle found")
 
 
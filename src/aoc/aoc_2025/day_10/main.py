@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
+import numpy as np
+
 from aoc.utils import get_logger, simple_txt_parser
 
 logger = get_logger(__name__)
 
+# One pass over a machine line: [lights] (button) (button) ... {voltages}
+PATTERN = re.compile(r"\[([.#]+)\]\s*((?:\([0-9,]+\)\s*)+)\{([0-9,]+)\}")
+BUTTON_PATTERN = re.compile(r"\(([0-9,]+)\)")
+LIGHT_BITS = str.maketrans(".#", "01")
+
 
 @dataclass
 class Machine:
@@ -21,6 +28,12 @@ class Machine:
   lights: int  # Bitmask of the target light configuration
   buttons: list[list[int]]  # List of lists: indices each button affects
   voltages: list[int]  # Voltage requirements (targets for counters)
+  button_bitmasks: tuple[int, ...] = field(init=False, repr=False)  # Lights each button toggles, as bitmasks
+  n_buttons: int = field(init=False, repr=False)
+
+  def __post_init__(self) -> None:
+    self.button_bitmasks = tuple(sum(1 << idx for idx in button) for button in self.buttons)
+    self.n_buttons = len(self.buttons)
 
   @staticmethod
   def from_data(data: str) -> Machine:
@@ -34,114 +47,124 @@ class Machine:
       contains comma-separated indices that the button toggles.
     - The braces contain comma-separated integer voltages.
     """
-    # Extract the desired state from brackets [.##.]
-    lights_match = re.search(r"\[([.#]+)\]", data)
-    if not lights_match:
-      raise ValueError(f"Could not parse desired state from: {data}")
-    lights = sum((1 if bit == "#" else 0) << idx for idx, bit in enumerate(lights_match.group(1)))
-    size = len(lights_match.group(1))
-    logger.debug(f"Desired state: {lights:0{size}b} ({size} bits)")
-
-    # Extract actuator groups from parentheses (indices each button toggles)
-    button_matches: list[str] = re.findall(r"\(([0-9,]+)\)", data)
-    if not button_matches:
-      raise ValueError(f"Could not parse buttons from: {data}")
-    buttons: list[list[int]] = []
-    for match in button_matches:
-      indices = [int(x) for x in match.split(",")]
-      buttons.append(indices)
-    logger.debug(f"Buttons: {buttons}")
-
-    # Extract voltages from braces {3,5,4,7}
-    voltage_match = re.search(r"\{([0-9,]+)\}", data)
-    if not voltage_match:
-      raise ValueError(f"Could not parse voltages from: {data}")
-    voltages = list(map(int, voltage_match.group(1).split(",")))
-    logger.debug(f"Voltages: {voltages}")
+    match = PATTERN.search(data)
+    if not match:
+      raise ValueError(f"Could not parse machine from: {data}")
+    lights_str, buttons_str, voltages_str = match.groups()
+
+    # Desired state from brackets [.##.]: light idx is bit idx, so reverse before reading it as binary
+    lights = int(lights_str.translate(LIGHT_BITS)[::-1], 2)
+    size = len(lights_str)
+    logger.debug("Desired state", lights=f"{lights:0{size}b}", size=size)
+
+    # Actuator groups from parentheses (indices each button toggles)
+    buttons = [[int(x) for x in group.split(",")] for group in BUTTON_PATTERN.findall(buttons_str)]
+    logger.debug("Buttons", buttons=buttons)
+
+    # Voltages from braces {3,5,4,7}
+    voltages = list(map(int, voltages_str.split(",")))
+    logger.debug("Voltages", voltages=voltages)
 
     return Machine(lights, buttons, voltages)
 
   def lights_solver(self, start: int = 0) -> int:
     """Solve for the minimum button presses to reach the desired state from start.
 
-    Since pressing a button twice is the same as not pressing it (XOR property),
-    we only need to consider pressing each button 0 or 1 time. This reduces the
-    problem to finding the smallest subset of buttons whose combined toggles
-    (XOR of their bitmasks) transform the start state to the desired state.
-
-    We use brute-force enumeration of all 2^n subsets, where n is the number
-    of buttons, which is efficient for small n (typically <= 10-20).
+    Pressing a button twice cancels out, so a solution is a subset of buttons whose
+    bitmasks XOR to start ^ lights: a linear system over GF(2). Gaussian elimination
+    gives one particular subset and a basis of the button combinations that toggle
+    nothing (the nullspace); only the 2^(n - rank) subsets in that coset are searched
+    instead of all 2^n.
     """
     if start == self.lights:
       return 0
 
-    # Compute bitmasks for buttons
-    button_bitmasks = [sum(1 << idx for idx in button) for button in self.buttons]
-
-    n = len(button_bitmasks)
-    min_presses: int = n + 1  # Initialize to an impossible value
-    for mask in range(1 << n):  # Iterate over all subsets (2^n possibilities)
-      xor_state = start
-      presses = 0
-      for i in range(n):
-        if mask & (1 << i):  # If button i is in the subset
-          xor_state ^= button_bitmasks[i]  # Apply the button's toggle
-          presses += 1
-      if xor_state == self.lights:
-        min_presses = min(min_presses, presses)
-
-    if min_presses > n:
-      raise RuntimeError("No solution found")
-    return min_presses
+    # XOR basis keyed by pivot bit: (reduced light bitmask, buttons combined to produce it)
+    basis: dict[int, tuple[int, int]] = {}
+    nullspace: list[int] = []
+    for j, bitmask in enumerate(self.button_bitmasks):
+      vector, combo = bitmask, 1 << j
+      while vector:
+        pivot = vector.bit_length() - 1
+        if pivot not in basis:
+          basis[pivot] = (vector, combo)
+          break
+        vector ^= basis[pivot][0]
+        combo ^= basis[pivot][1]
+      else:
+        # The button is a combination of earlier ones: their XOR toggles nothing
+        nullspace.append(combo)
+
+    # Reduce the target against the basis to get a particular solution
+    target, solution = start ^ self.lights, 0
+    while target:
+      pivot = target.bit_length() - 1
+      if pivot not in basis:
+        raise RuntimeError("No solution found")
+      target ^= basis[pivot][0]
+      solution ^= basis[pivot][1]
+
+    # Every solution is the particular one XOR a combination of nullspace vectors
+    candidates = [solution]
+    for combo in nullspace:
+      candidates += [candidate ^ combo for candidate in candidates]
+    return min(candidate.bit_count() for candidate in candidates)
 
   def voltage_solver(self) -> int:
     """Solve for the minimum button presses to reach the target voltages from all zeros.
 
-    Uses PuLP (integer linear programming) to minimize the total number of button presses
-    subject to the constraint that each counter reaches its target value exactly.
+    Each counter must reach its target exactly: A x = voltages, where A[i, j] = 1 if button j
+    affects counter i and x[j] is the number of presses of button j. When A is square and
+    full-rank that solution is unique, so it is solved directly. Otherwise SciPy's MILP
+    solver (HiGHS, in-process) minimizes the total number of presses.
     """
-    import pulp
+    from scipy.optimize import Bounds, LinearConstraint, milp
 
-    n_buttons = len(self.buttons)
+    n_buttons = self.n_buttons
     n_counters = len(self.voltages)
 
-    # Create the LP problem
-    problem = pulp.LpProblem("Voltage_Configuration", pulp.LpMinimize)
+    # Constraint matrix: column j marks the counters button j increments
+    matrix = np.zeros((n_counters, n_buttons), dtype=np.int64)
+    for j, button in enumerate(self.buttons):
+      matrix[button, j] = 1
+    targets = np.array(self.voltages, dtype=np.int64)
 
-    # Decision variables: x[j] = number of times button j is pressed (non-negative integer)
-    x_vars = [pulp.LpVariable(f"x_{j}", lowBound=0, cat="Integer") for j in range(n_buttons)]
+    # Unique solution: accept it if it is a valid non-negative integer press count
+    if n_counters == n_buttons and np.linalg.matrix_rank(matrix) == n_buttons:
+      presses = np.rint(np.linalg.solve(matrix.astype(float), targets)).astype(np.int64)
+      if (presses >= 0).all() and np.array_equal(matrix @ presses, targets):
+        return int(presses.sum())
 
-    # Objective: minimize total presses
-    problem += pulp.lpSum(x_vars), "Total_Presses"
+    # Objective: minimize total presses subject to each counter reaching its target
+    solution = milp(
+      c=np.ones(n_buttons),
+      constraints=LinearConstraint(matrix, targets, targets),
+      integrality=np.ones(n_buttons),
+      bounds=Bounds(0, np.inf),
+    )
 
-    # Constraints: for each counter i, sum of presses of buttons affecting i == target[i]
-    for i in range(n_counters):
-      constraint_expr = pulp.lpSum(x_vars[j] for j in range(n_buttons) if i in self.buttons[j])
-      problem += constraint_expr == self.voltages[i], f"Counter_{i}"
+    if not solution.success:
+      raise RuntimeError(f"No optimal solution found: {solution.message}")
 
-    # Solve
-    solver = pulp.PULP_CBC_CMD(msg=False)
-    problem.solve(solver)
+    return int(np.rint(solution.x).sum())
 
-    if pulp.LpStatus[problem.status] != "Optimal":
-      raise RuntimeError(f"No optimal solution found: {pulp.LpStatus[problem.status]}")
 
-    return sum(int(pulp.value(var)) for var in x_vars)  # type: ignore[arg-type]
+def load(raw: list[str]) -> list[Machine]:
+  """Parse every machine once, so both parts can share them."""
+  return [Machine.from_data(line) for line in raw]
 
 
-def part_1(raw: list[str]) -> int:
+def part_1(machines: list[Machine]) -> int:
   result = 0
-  for line in raw:
-    machine = Machine.from_data(line)
+  for machine in machines:
     presses = machine.lights_solver()
     result += presses
   return result
 
 
-def part_2(raw: list[str]) -> int:
+def part_2(machines: list[Machine]) -> int:
   result = 0
-  for line in raw:
-    machine = Machine.from_data(line)
+  for machine in machines:
     presses = machine.voltage_solver()
     result += presses
   return result
@@ -153,7 +176,8 @@ if __name__ == "__main__":
   filename: str = "input.txt"
   file_path = Path(__file__).parent / filename
   data = simple_txt_parser(file_path)
+  machines = load(data)
 
   logger.info("Starting Day 10 Solutions")
-  logger.info(f"Part 1: {part_1(data)}")  # 404
-  logger.info(f"Part 2: {part_2(data)}")
+  logger.info(f"Part 1: {part_1(machines)}")  # 404
+  logger.info(f"Part 2: {part_2(machines)}")  # 16474
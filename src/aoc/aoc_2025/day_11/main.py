@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 
 from aoc.utils import get_logger, simple_txt_parser
@@ -13,7 +14,17 @@ class Device:
   """Represents a device network with connections."""
 
   mapping: dict[str, list[str]]
-  _memo: dict[tuple[str, tuple[str, ...]], int] = field(default_factory=dict)
+  _node_id: dict[str, int] = field(init=False, repr=False)  # Node name -> id, with 'out' as id 0
+  _adj: list[list[int]] = field(init=False, repr=False)  # Neighbor ids indexed by node id
+
+  def __post_init__(self) -> None:
+    self._node_id = {"out": 0}
+    for tag, conn in self.mapping.items():
+      for node in (tag, *conn):
+        self._node_id.setdefault(node, len(self._node_id))
+    self._adj = [[] for _ in self._node_id]
+    for tag, conn in self.mapping.items():
+      self._adj[self._node_id[tag]] = [self._node_id[node] for node in conn]
 
   @staticmethod
   def from_data(data: list[str]) -> Device:
@@ -26,28 +37,30 @@ class Device:
 
   def traverse_mapping(self, current: str, constraint: tuple[str, ...] = ()) -> int:
     """Counts paths from current to 'out' that visit all in constraint."""
-    key = (current, constraint)
-    if key in self._memo:
-      return self._memo[key]
-    if current == "out":
-      result = int(len(constraint) == 0)
-    else:
-      if current in constraint:
-        constraint = tuple(x for x in constraint if x != current)
-      result = sum(self.traverse_mapping(neighbor, constraint) for neighbor in self.mapping.get(current, []))
-    self._memo[key] = result
-    return result
-
-
-def part_1(data: list[str]) -> int:
+    # Constraint nodes still to visit are tracked as a bitmask over their positions in constraint
+    required = [self._node_id.get(node) for node in dict.fromkeys(constraint)]
+    if current not in self._node_id or None in required:
+      return 0  # Unknown start or a constraint node that is not in the network
+    constraint_bits = {node: 1 << idx for idx, node in enumerate(required)}
+    adj = self._adj
+
+    @cache
+    def count_paths(node: int, remaining: int) -> int:
+      if node == 0:  # 'out'
+        return int(remaining == 0)
+      remaining &= ~constraint_bits.get(node, 0)
+      return sum(count_paths(neighbor, remaining) for neighbor in adj[node])
+
+    return count_paths(self._node_id[current], (1 << len(required)) - 1)
+
+
+def part_1(server: Device) -> int:
   """Counts the number of paths from 'you' to 'out'."""
-  server: Device = Device.from_data(data)
   return server.traverse_mapping("you")
 
 
-def part_2(data: list[str]) -> int:
+def part_2(server: Device) -> int:
   """Counts paths from 'svr' to 'out' that visit both 'dac' and 'fft'."""
-  server: Device = Device.from_data(data)
   return server.traverse_mapping("svr", ("dac", "fft"))
 
 
@@ -57,7 +70,8 @@ if __name__ == "__main__":
   filename: str = "input.txt"
   file_path: Path = Path(__file__).parent / filename
   data: list[str] = simple_txt_parser(file_path)
+  server: Device = Device.from_data(data)
 
   logger.info("Starting Day 11 Solutions")
-  logger.info(f"Part 1: {part_1(data)}")  # 640
-  logger.info(f"Part 2: {part_2(data)}")  # 367579641755680
+  logger.info(f"Part 1: {part_1(server)}")  # 640
+  logger.info(f"Part 2: {part_2(server)}")  # 367579641755680
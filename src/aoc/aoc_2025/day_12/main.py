@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
+
 from aoc.utils import get_logger, simple_txt_parser
 
 logger = get_logger(__name__)
@@ -50,24 +53,45 @@ def parse_input(data: list[str]) -> tuple[dict[int, set[tuple[int, int]]], list[
 
 
 def extract_shape_from_lines(lines: list[str]) -> set[tuple[int, int]]:
-  """Extract cell coordinates from shape lines."""
-  cells = set()
-  for r, line in enumerate(lines):
-    for c, char in enumerate(line):
-      if char == "#":
-        cells.add((r, c))
+  """Extract cell coordinates from shape lines.
+
+  The lines are padded to a common width and viewed as a 2D byte array, so finding the '#'
+  cells is a single vectorized comparison.
+  """
+  width = max((len(line) for line in lines), default=0)
+  padded = "".join(line.ljust(width) for line in lines).encode("ascii", errors="replace")
+  grid = np.frombuffer(padded, dtype=np.uint8).reshape(len(lines), width)
+  cells = np.argwhere(grid == ord("#"))
 
   # Normalize
-  if cells:
-    min_r = min(r for r, c in cells)
-    min_c = min(c for r, c in cells)
-    return {(r - min_r, c - min_c) for r, c in cells}
+  if cells.size:
+    cells -= cells.min(axis=0)
+    return set(map(tuple, cells.tolist()))
   return set()
 
 
-def can_fit_by_area(width: int, height: int, present_counts: list[int], shape_sizes: dict[int, int]) -> bool | None:
+def bounding_box(cells: set[tuple[int, int]]) -> tuple[int, int]:
+  """Return the (short, long) sides of the shape's bounding box.
+
+  Sorting the sides makes the result the same for every orientation of the shape.
+  """
+  if not cells:
+    return 0, 0
+  rows = [r for r, _ in cells]
+  cols = [c for _, c in cells]
+  h, w = max(rows) - min(rows) + 1, max(cols) - min(cols) + 1
+  return min(h, w), max(h, w)
+
+
+def can_fit_by_area(
+  width: int,
+  height: int,
+  present_counts: list[int],
+  shape_sizes: dict[int, int],
+  shape_bboxes: dict[int, tuple[int, int]],
+) -> bool | None:
   """
-  Quick check if presents can fit based on area alone.
+  Quick check if presents can fit based on area and bounding boxes alone.
   Returns True if definitely fits, False if definitely doesn't fit, None if uncertain.
   """
   grid_area = width * height
@@ -77,75 +101,67 @@ def can_fit_by_area(width: int, height: int, present_counts: list[int], shape_si
   if total_present_cells > grid_area:
     return False
 
+  # Obviously impossible - a requested present is too long or too wide for the region in any orientation
+  region_short, region_long = min(width, height), max(width, height)
+  requested = [shape_bboxes.get(i, (0, 0)) for i, count in enumerate(present_counts) if count > 0]
+  if any(short > region_short or long > region_long for short, long in requested):
+    return False
+
   # Calculate total number of presents
   total_presents = sum(present_counts)
 
-  # Check if even with wasteful packing (3x3 per present), there's room
-  # This uses the loose bound: each present needs at most a 3x3 block
-  max_3x3_blocks = (width // 3) * (height // 3)
-
-  if total_presents <= max_3x3_blocks:
+  # Check if even with wasteful packing (one bounding box per present), there's room
+  # This uses the loose bound: every requested present fits in a box_short x box_long block
+  # (3x3 for the puzzle shapes), tiled in whichever orientation gives more blocks
+  box_short = max((short for short, _ in requested), default=1)
+  box_long = max((long for _, long in requested), default=1)
+  max_blocks = max(
+    (width // box_short) * (height // box_long),
+    (width // box_long) * (height // box_short),
+  )
+
+  if total_presents <= max_blocks:
     return True
 
   # Uncertain - need actual packing
   return None
 
 
+# Clockwise rotation as a row-vector matrix product: (r, c) @ ROTATE_90 -> (c, -r)
+ROTATE_90 = np.array([[0, -1], [1, 0]], dtype=np.int8)
+
+
 def get_all_orientations(cells: set[tuple[int, int]]) -> list[set[tuple[int, int]]]:
   """Generate all unique orientations (rotations and flips).
 
   Generates up to 8 distinct orientations: 4 rotations and 4 flipped rotations.
+  Cells are held as a small (N, 2) int8 array, so rotating is a matrix product and normalizing to
+  the (0, 0) origin is a single subtraction of the column minimums.
   Uses a set to automatically deduplicate identical shapes (e.g., squares only have 1 unique orientation).
   """
+  if not cells:
+    return [set()]
 
-  def rotate_90(coords: set[tuple[int, int]]) -> set[tuple[int, int]]:
-    """Rotate 90 degrees clockwise: (r,c) -> (c,-r)"""
-    return {(c, -r) for r, c in coords}
-
-  def flip_horizontal(coords: set[tuple[int, int]]) -> set[tuple[int, int]]:
-    """Flip horizontally: (r,c) -> (r,-c)"""
-    return {(r, -c) for r, c in coords}
-
-  def normalize(coords: set[tuple[int, int]]) -> frozenset[tuple[int, int]]:
-    """Normalize to canonical form starting at (0, 0)."""
-    if not coords:
-      return frozenset()
-    min_r = min(r for r, c in coords)
-    min_c = min(c for r, c in coords)
-    return frozenset((r - min_r, c - min_c) for r, c in coords)
-
-  orientations = set()
-  current = cells
+  orientations: set[frozenset[tuple[int, int]]] = set()
+  original = np.array(sorted(cells), dtype=np.int8)
+  flipped = original * np.array([1, -1], dtype=np.int8)  # Flip horizontally: (r, c) -> (r, -c)
 
-  # Generate 4 rotations
-  for _ in range(4):
-    orientations.add(normalize(current))
-    current = rotate_90(current)
-
-  # Generate 4 more rotations from the flipped version
-  current = flip_horizontal(cells)
-  for _ in range(4):
-    orientations.add(normalize(current))
-    current = rotate_90(current)
+  # Generate 4 rotations of the original and 4 more from the flipped version
+  for current in (original, flipped):
+    for _ in range(4):
+      normalized = current - current.min(axis=0)
+      orientations.add(frozenset(map(tuple, normalized.tolist())))
+      current = current @ ROTATE_90
 
   return [set(o) for o in orientations]
 
 
-def can_place(grid: list[list[bool]], cells: set[tuple[int, int]], row: int, col: int, width: int, height: int) -> bool:
-  """Check if shape can be placed at (row, col)."""
-  for r, c in cells:
-    nr, nc = row + r, col + c
-    if nr < 0 or nr >= height or nc < 0 or nc >= width:
-      return False
-    if grid[nr][nc]:
-      return False
-  return True
-
+def shape_mask(cells: set[tuple[int, int]], row: int, col: int, width: int) -> int:
+  """Return the grid bitmask covered by a shape anchored at (row, col).
 
-def place(grid: list[list[bool]], cells: set[tuple[int, int]], row: int, col: int, mark: bool) -> None:
-  """Place or remove shape on grid."""
-  for r, c in cells:
-    grid[row + r][col + c] = mark
+  The grid is stored as a single integer where cell (r, c) maps to bit r * width + c.
+  """
+  return sum(1 << ((row + r) * width + (col + c)) for r, c in cells)
 
 
 def solve_region_backtrack(
@@ -153,12 +169,20 @@ def solve_region_backtrack(
 ) -> bool:
   """Try to fit all presents into the region using backtracking (only for borderline cases).
 
+  The grid is a bitmask (see shape_mask), so collision checks, placement and state hashing are
+  integer operations instead of list-of-list scans.
+
   Key optimizations:
   - Adjacent-only placement: only try positions adjacent to already-placed shapes (not entire grid)
-  - Memoization: cache grid states to avoid redundant exploration
+  - Memoization: cache grid states at join points between shapes to avoid redundant exploration
   - Cell counting: prune branches if not enough cells remain for remaining presents
   """
-  grid = [[False] * width for _ in range(height)]
+  grid_area = width * height
+  full_mask = (1 << grid_area) - 1
+  # Masks that drop bits which would wrap around a row edge after a horizontal shift
+  first_col = sum(1 << (row * width) for row in range(height))
+  not_first_col = full_mask & ~first_col
+  not_last_col = full_mask & ~(first_col << (width - 1))
 
   # Build flat list of all presents to place in order
   presents = []
@@ -166,85 +190,113 @@ def solve_region_backtrack(
     for _ in range(count):
       presents.append(shape_id)
 
-  # Memoization cache: maps (grid_state, present_index) -> bool
-  memo: dict[tuple, bool] = {}
-
-  def get_grid_state() -> tuple:
-    """Get hashable grid state for memoization."""
-    return tuple(tuple(row) for row in grid)
-
-  def count_empty_cells() -> int:
+  def dilate(mask: int) -> int:
+    """Return the cells 4-adjacent to the mask, excluding the mask itself and any row wrap-around."""
+    dilated = ((mask << 1) & not_first_col) | ((mask >> 1) & not_last_col) | (mask << width) | (mask >> width)
+    return dilated & full_mask & ~mask
+
+  # Precompute every in-bounds placement once per region: placements[shape_id][cell] lists the
+  # (mask, halo) pairs of all orientations anchored at that cell (bit index), where halo is the ring of
+  # cells adjacent to the placed shape. The search only ANDs/ORs ready-made masks.
+  placements: dict[int, list[list[tuple[int, int]]]] = {}
+  for shape_id in set(presents):
+    by_anchor: list[list[tuple[int, int]]] = [[] for _ in range(grid_area)]
+    for cells in all_orientations[shape_id]:
+      base_mask = shape_mask(cells, 0, 0, width)
+      max_r = max((r for r, _ in cells), default=0)
+      max_c = max((c for _, c in cells), default=0)
+      for row in range(height - max_r):
+        for col in range(width - max_c):
+          mask = base_mask << (row * width + col)
+          by_anchor[row * width + col].append((mask, dilate(mask)))
+    placements[shape_id] = by_anchor
+
+  n_presents = len(presents)
+
+  # Memoization cache: maps (grid_bitmask, present_index) packed into a single int -> bool.
+  # The index lives in the low idx_bits bits, so hashing a key is one int hash instead of a tuple.
+  memo: dict[int, bool] = {}
+  idx_bits = n_presents.bit_length()
+  # Selective memoization: only record states at join points, where the next present is a different
+  # shape from the previous one. Most other nodes are never revisited, so storing them wastes memory
+  # and hashing time.
+  memoize_at = [i > 0 and presents[i] != presents[i - 1] for i in range(n_presents)]
+
+  def count_empty_cells(grid: int) -> int:
     """Count empty cells in the grid."""
-    return sum(1 for row in grid for cell in row if not cell)
+    return grid_area - grid.bit_count()
 
-  def get_adjacent_positions() -> set[tuple[int, int]]:
-    """Get all positions adjacent to filled cells. This is the key optimization.
+  def get_adjacent_positions(grid: int, frontier: int) -> list[int]:
+    """Get all positions (as bit indices) adjacent to filled cells. This is the key optimization.
 
     Instead of trying all height*width positions, we only try positions that are adjacent
-    to already-placed shapes. This drastically reduces the search space.
+    to already-placed shapes. This drastically reduces the search space. The frontier (empty
+    cells next to filled ones) is maintained incrementally by backtrack, so this only decodes it.
 
     For the first present, returns the first empty cell.
     """
-    adjacent = set()
-    has_placed = False
-    for row in range(height):
-      for col in range(width):
-        if grid[row][col]:
-          has_placed = True
-          # Add all 4-connected neighbors of this filled cell
-          for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nr, nc = row + dr, col + dc
-            if 0 <= nr < height and 0 <= nc < width and not grid[nr][nc]:
-              adjacent.add((nr, nc))
-
-    # If nothing placed yet, return first empty cell to start placement
-    if not has_placed:
-      for row in range(height):
-        for col in range(width):
-          if not grid[row][col]:
-            return {(row, col)}
-
+    if not grid:
+      return [0]
+
+    adjacent = []
+    while frontier:
+      lowest = frontier & -frontier
+      adjacent.append(lowest.bit_length() - 1)
+      frontier ^= lowest
     return adjacent
 
-  def backtrack(idx: int) -> bool:
+  def backtrack(grid: int, frontier: int, idx: int) -> bool:
     """Recursively try to place all remaining presents."""
-    if idx == len(presents):
+    if idx == n_presents:
       # Successfully placed all presents
       return True
 
     # Check if this state was already explored
-    state = (get_grid_state(), idx)
-    if state in memo:
+    memoize = memoize_at[idx]
+    state = (grid << idx_bits) | idx if memoize else -1
+    if memoize and state in memo:
       return memo[state]
 
     # Pruning: if we need more cells than available, it's impossible
-    remaining_presents = len(presents) - idx
-    if remaining_presents > count_empty_cells():
-      memo[state] = False
+    remaining_presents = n_presents - idx
+    if remaining_presents > count_empty_cells(grid):
+      if memoize:
+        memo[state] = False
       return False
 
-    shape_id = presents[idx]
-    adjacent_positions = get_adjacent_positions()
-
-    # Try all orientations of the current shape
-    for orientation in all_orientations[shape_id]:
-      # Try only adjacent positions (key optimization)
-      for row, col in adjacent_positions:
-        if can_place(grid, orientation, row, col, width, height):
-          # Place the shape
-          place(grid, orientation, row, col, True)
-          # Recursively try to place remaining presents
-          if backtrack(idx + 1):
-            memo[state] = True
-            return True
-          # Backtrack: remove the shape
-          place(grid, orientation, row, col, False)
+    shape_placements = placements[presents[idx]]
+
+    # Try only adjacent positions (key optimization), with every orientation that fits there
+    for cell in get_adjacent_positions(grid, frontier):
+      for mask, halo in shape_placements[cell]:
+        if grid & mask:
+          continue
+        # Placing builds a new grid and frontier, so backtracking needs no explicit removal. The new
+        # frontier only changes around the placed shape: add its halo, drop the cells it now covers.
+        new_grid = grid | mask
+        if backtrack(new_grid, (frontier | halo) & ~new_grid, idx + 1):
+          return True
 
     # No valid placement found for this present
-    memo[state] = False
+    if memoize:
+      memo[state] = False
     return False
 
-  return backtrack(0)
+  return backtrack(0, 0, 0)
+
+
+# Orientations used by solve_query, built once per worker process by init_worker
+_worker_orientations: dict[int, list[set[tuple[int, int]]]] = {}
+
+
+def init_worker(shapes: dict[int, set[tuple[int, int]]]) -> None:
+  """Process pool initializer: generate the orientations of every shape once per worker."""
+  _worker_orientations.update({shape_id: get_all_orientations(cells) for shape_id, cells in shapes.items()})
+
+
+def solve_query(query: dict) -> bool:
+  """Run the backtracking solver for one region query inside a worker process."""
+  return solve_region_backtrack(query["width"], query["height"], query["counts"], _worker_orientations)
 
 
 def part_1(shapes: dict[int, set[tuple[int, int]]], queries: list[dict]) -> int:
@@ -252,45 +304,44 @@ def part_1(shapes: dict[int, set[tuple[int, int]]], queries: list[dict]) -> int:
 
   Two-tier strategy:
   1. Fast heuristic checks (area-based) eliminate most cases
-  2. Expensive backtracking only for borderline cases
+  2. Expensive backtracking only for borderline cases, spread across a process pool since
+     queries are independent and only share the read-only shapes
   """
-  # Precompute shape sizes for quick checking
+  # Precompute shape sizes and bounding boxes for quick checking
   shape_sizes: dict[int, int] = {shape_id: len(cells) for shape_id, cells in shapes.items()}
-
-  # Lazy-load orientations only if backtracking is needed
-  all_orientations: dict[int, list[set[tuple[int, int]]]] | None = None
+  shape_bboxes: dict[int, tuple[int, int]] = {shape_id: bounding_box(cells) for shape_id, cells in shapes.items()}
 
   count = 0
+  uncertain: list[dict] = []
   for query in queries:
     width = query["width"]
     height = query["height"]
     present_counts = query["counts"]
 
     # Tier 1: Try quick area-based checks first (O(1))
-    can_fit = can_fit_by_area(width, height, present_counts, shape_sizes)
+    can_fit = can_fit_by_area(width, height, present_counts, shape_sizes, shape_bboxes)
 
     if can_fit is True:
       # Definitely fits based on loose packing estimate
       count += 1
-      logger.debug(f"Region {width}x{height}: definitely fits (loose packing)")
+      logger.debug("Region definitely fits (loose packing)", width=width, height=height)
     elif can_fit is False:
-      # Definitely doesn't fit due to insufficient area
-      logger.debug(f"Region {width}x{height}: definitely doesn't fit (area)")
+      # Definitely doesn't fit due to insufficient area or a present larger than the region
+      logger.debug("Region definitely doesn't fit (area)", width=width, height=height)
     else:
       # Tier 2: Borderline case requires expensive backtracking
-      logger.debug(f"Region {width}x{height}: uncertain, trying backtracking")
-
-      # Lazy initialization: only generate orientations if we actually need backtracking
-      if all_orientations is None:
-        all_orientations = {}
-        for shape_id, cells in shapes.items():
-          all_orientations[shape_id] = get_all_orientations(cells)
-
-      if solve_region_backtrack(width, height, present_counts, all_orientations):
-        count += 1
-        logger.debug(f"Region {width}x{height}: fits (via backtracking)")
-      else:
-        logger.debug(f"Region {width}x{height}: doesn't fit (via backtracking)")
+      logger.debug("Region uncertain, trying backtracking", width=width, height=height)
+      uncertain.append(query)
+
+  # Lazy initialization: only start workers (and generate orientations) if we actually need backtracking
+  if uncertain:
+    with ProcessPoolExecutor(initializer=init_worker, initargs=(shapes,)) as executor:
+      for query, fits in zip(uncertain, executor.map(solve_query, uncertain), strict=True):
+        if fits:
+          count += 1
+          logger.debug("Region fits (via backtracking)", width=query["width"], height=query["height"])
+        else:
+          logger.debug("Region doesn't fit (via backtracking)", width=query["width"], height=query["height"])
 
   return count
 
@@ -1,4 +1,4 @@
-from .parse_txt import separator_parser, simple_txt_parser
+from .parse_txt import fast_bytes_parser, separator_parser, simple_txt_parser
 from .structlog import get_logger
 
-__all__ = ["simple_txt_parser", "get_logger", "separator_parser"]
+__all__ = ["simple_txt_parser", "get_logger", "separator_parser", "fast_bytes_parser"]
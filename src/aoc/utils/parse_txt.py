@@ -41,6 +41,27 @@ def simple_txt_parser(file_path: Path, parser: Callable[[str], T] | None = None)
     raise FileNotFoundError(f"The file {file_path} does not exist.")
 
   with file_path.open("r", encoding="utf-8") as file:
-    lines = [line.rstrip("\n") for line in file.readlines()]
+    if parser is not None:
+      return [parser(line.rstrip("\n")) for line in file]
+    return [line.rstrip("\n") for line in file]
 
-  return [parser(line) for line in lines] if parser is not None else lines
+
+def fast_bytes_parser(file_path: Path) -> list[bytes]:
+  """
+  Read a file as raw bytes in one call and split it into lines, skipping text decoding.
+
+  Useful for ASCII inputs whose downstream parsing works on bytes (e.g. splitting on b",").
+
+  Args:
+      file_path: Path to the file.
+
+  Returns:
+      List of lines as bytes, without line terminators.
+
+  Raises:
+      FileNotFoundError: If the file does not exist.
+  """
+  if not file_path.exists():
+    raise FileNotFoundError(f"The file {file_path} does not exist.")
+
+  return file_path.read_bytes().splitlines()